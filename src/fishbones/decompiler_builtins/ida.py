@@ -1,7 +1,7 @@
 """Implement functions which are used in the code decompiled by IDA."""
 
-import sys
-from typing import Type, TypeVar
+import array
+from typing import TYPE_CHECKING, Dict, Tuple, Type, TypeVar, Union
 
 from ..consts import BIG_ENDIAN, LITTLE_ENDIAN
 from ..integer import (
@@ -9,31 +9,56 @@ from ..integer import (
     Int8,
     Int16,
     Int32,
+    Int64,
     UInt8,
     UInt16,
     UInt32,
     UInt64,
-    get_type_size,
 )
 
-
-if sys.version_info >= (3, 8):
-    from typing import Literal
-else:
+if TYPE_CHECKING:
     from typing_extensions import Literal
 
 
 _T = TypeVar("_T", bound=Integer)
 
+_UINT32_TYPECODE = "I" if array.array("I").itemsize == 4 else "L"
+
+_TO_UNSIGNED: Dict[Type[Integer], Type[Integer]] = {
+    Int8: UInt8,
+    Int16: UInt16,
+    Int32: UInt32,
+    Int64: UInt64,
+    UInt8: UInt8,
+    UInt16: UInt16,
+    UInt32: UInt32,
+    UInt64: UInt64,
+}
+
+_PAIR_TABLE: Dict[Type[Integer], Tuple[Type[Integer], int, int]] = {
+    Int8: (Int16, 8, 0xFF),
+    Int16: (Int32, 16, 0xFFFF),
+    Int32: (Int64, 32, 0xFFFFFFFF),
+    UInt8: (UInt16, 8, 0xFF),
+    UInt16: (UInt32, 16, 0xFFFF),
+    UInt32: (UInt64, 32, 0xFFFFFFFF),
+}
+
 
 # Refer to defs.h of IDA.
 
 
 def truncate(x: Integer, c: int, to_type: Type[_T]) -> _T:
     """Truncate."""
-    data = x.to_bytes()
-    to_size = get_type_size(to_type)
-    return to_type.from_bytes(data[c : c + to_size])
+    v = (int(x) & x.MASK) >> c * 8
+
+    # Like the bytes based version, sign extend a signed part from the bytes
+    # available when it runs past the end of ``x``.
+    nbits = x.NBITS - c * 8
+    if to_type.SIGNED and 0 < nbits < to_type.NBITS:
+        v -= (v & (1 << (nbits - 1))) << 1
+
+    return to_type(v & to_type.MASK)
 
 
 def zero_extend(x: Integer, to_type: Type[_T]) -> _T:
@@ -43,20 +68,20 @@ def zero_extend(x: Integer, to_type: Type[_T]) -> _T:
 
 def sign_extend(x: Integer, to_type: Type[_T]) -> _T:
     """Sign extend."""
-    t1 = Integer.get_type(size=x.size, signed=True)
-    t2 = Integer.get_type(size=get_type_size(to_type), signed=True)
+    t1 = Integer.get_type(size=x.SIZE, signed=True)
+    t2 = Integer.get_type(size=to_type.SIZE, signed=True)
     return to_type.from_bytes(t2.from_bytes(t1(x).to_bytes()).to_bytes())
 
 
 def last_ind(x: Integer, part_type: Type[Integer]) -> int:
     """Implementation of `LAST_IND`."""
-    return x.size // get_type_size(part_type) - 1
+    return x.SIZE // part_type.SIZE - 1
 
 
 def low_ind(
     x: Integer,
     part_type: Type[Integer],
-    byteorder: Literal["big", "little"] = LITTLE_ENDIAN,
+    byteorder: "Literal['big', 'little']" = LITTLE_ENDIAN,
 ) -> int:
     """Implementation of `LOW_IND`."""
     return last_ind(x, part_type) if byteorder == BIG_ENDIAN else 0
@@ -65,7 +90,7 @@ def low_ind(
 def high_ind(
     x: Integer,
     part_type: Type[Integer],
-    byteorder: Literal["big", "little"] = LITTLE_ENDIAN,
+    byteorder: "Literal['big', 'little']" = LITTLE_ENDIAN,
 ) -> int:
     """Implementation of `HIGH_IND`."""
     return 0 if byteorder == BIG_ENDIAN else last_ind(x, part_type)
@@ -88,157 +113,165 @@ def dwordn(x: Integer, n: int) -> UInt32:
 
 def lobyte(x: Integer) -> UInt8:
     """Implementation of `LOBYTE`."""
-    return byten(x, low_ind(x, UInt8))
+    return UInt8(int(x) & x.MASK & 0xFF)
 
 
 def loword(x: Integer) -> UInt16:
     """Implementation of `LOWORD`."""
-    return wordn(x, low_ind(x, UInt16))
+    return UInt16(int(x) & x.MASK & 0xFFFF)
 
 
 def lodword(x: Integer) -> UInt32:
     """Implementation of `LODWORD`."""
-    return dwordn(x, low_ind(x, UInt32))
+    return UInt32(int(x) & x.MASK & 0xFFFFFFFF)
 
 
 def hibyte(x: Integer) -> UInt8:
     """Implementation of `HIBYTE`."""
-    return byten(x, high_ind(x, UInt8))
+    return UInt8((int(x) >> (x.NBITS - 8)) & 0xFF)
 
 
 def hiword(x: Integer) -> UInt16:
     """Implementation of `HIWORD`."""
-    return wordn(x, high_ind(x, UInt16))
+    shift = x.NBITS - 16
+    if shift < 0:
+        return UInt16(0)
+
+    return UInt16((int(x) >> shift) & 0xFFFF)
 
 
 def hidword(x: Integer) -> UInt32:
     """Implementation of `HIDWORD`."""
-    return dwordn(x, high_ind(x, UInt32))
+    shift = x.NBITS - 32
+    if shift < 0:
+        return UInt32(0)
+
+    return UInt32((int(x) >> shift) & 0xFFFFFFFF)
 
 
 def byte1(x: Integer) -> UInt8:
     """Implementation of `BYTE1`."""
-    return byten(x, 1)
+    return UInt8(((int(x) & x.MASK) >> 8) & 0xFF)
 
 
 def byte2(x: Integer) -> UInt8:
     """Implementation of `BYTE2`."""
-    return byten(x, 2)
+    return UInt8(((int(x) & x.MASK) >> 16) & 0xFF)
 
 
 def byte3(x: Integer) -> UInt8:
     """Implementation of `BYTE3`."""
-    return byten(x, 3)
+    return UInt8(((int(x) & x.MASK) >> 24) & 0xFF)
 
 
 def byte4(x: Integer) -> UInt8:
     """Implementation of `BYTE4`."""
-    return byten(x, 4)
+    return UInt8(((int(x) & x.MASK) >> 32) & 0xFF)
 
 
 def byte5(x: Integer) -> UInt8:
     """Implementation of `BYTE5`."""
-    return byten(x, 5)
+    return UInt8(((int(x) & x.MASK) >> 40) & 0xFF)
 
 
 def byte6(x: Integer) -> UInt8:
     """Implementation of `BYTE6`."""
-    return byten(x, 6)
+    return UInt8(((int(x) & x.MASK) >> 48) & 0xFF)
 
 
 def byte7(x: Integer) -> UInt8:
     """Implementation of `BYTE7`."""
-    return byten(x, 7)
+    return UInt8(((int(x) & x.MASK) >> 56) & 0xFF)
 
 
 def byte8(x: Integer) -> UInt8:
     """Implementation of `BYTE8`."""
-    return byten(x, 8)
+    return UInt8(((int(x) & x.MASK) >> 64) & 0xFF)
 
 
 def byte9(x: Integer) -> UInt8:
     """Implementation of `BYTE9`."""
-    return byten(x, 9)
+    return UInt8(((int(x) & x.MASK) >> 72) & 0xFF)
 
 
 def byte10(x: Integer) -> UInt8:
     """Implementation of `BYTE10`."""
-    return byten(x, 10)
+    return UInt8(((int(x) & x.MASK) >> 80) & 0xFF)
 
 
 def byte11(x: Integer) -> UInt8:
     """Implementation of `BYTE11`."""
-    return byten(x, 11)
+    return UInt8(((int(x) & x.MASK) >> 88) & 0xFF)
 
 
 def byte12(x: Integer) -> UInt8:
     """Implementation of `BYTE12`."""
-    return byten(x, 12)
+    return UInt8(((int(x) & x.MASK) >> 96) & 0xFF)
 
 
 def byte13(x: Integer) -> UInt8:
     """Implementation of `BYTE13`."""
-    return byten(x, 13)
+    return UInt8(((int(x) & x.MASK) >> 104) & 0xFF)
 
 
 def byte14(x: Integer) -> UInt8:
     """Implementation of `BYTE14`."""
-    return byten(x, 14)
+    return UInt8(((int(x) & x.MASK) >> 112) & 0xFF)
 
 
 def byte15(x: Integer) -> UInt8:
     """Implementation of `BYTE15`."""
-    return byten(x, 15)
+    return UInt8(((int(x) & x.MASK) >> 120) & 0xFF)
 
 
 def word1(x: Integer) -> UInt16:
     """Implementation of `WORD1`."""
-    return wordn(x, 1)
+    return UInt16(((int(x) & x.MASK) >> 16) & 0xFFFF)
 
 
 def word2(x: Integer) -> UInt16:
     """Implementation of `WORD2`."""
-    return wordn(x, 2)
+    return UInt16(((int(x) & x.MASK) >> 32) & 0xFFFF)
 
 
 def word3(x: Integer) -> UInt16:
     """Implementation of `WORD3`."""
-    return wordn(x, 3)
+    return UInt16(((int(x) & x.MASK) >> 48) & 0xFFFF)
 
 
 def word4(x: Integer) -> UInt16:
     """Implementation of `WORD4`."""
-    return wordn(x, 4)
+    return UInt16(((int(x) & x.MASK) >> 64) & 0xFFFF)
 
 
 def word5(x: Integer) -> UInt16:
     """Implementation of `WORD5`."""
-    return wordn(x, 5)
+    return UInt16(((int(x) & x.MASK) >> 80) & 0xFFFF)
 
 
 def word6(x: Integer) -> UInt16:
     """Implementation of `WORD6`."""
-    return wordn(x, 6)
+    return UInt16(((int(x) & x.MASK) >> 96) & 0xFFFF)
 
 
 def word7(x: Integer) -> UInt16:
     """Implementation of `WORD7`."""
-    return wordn(x, 7)
+    return UInt16(((int(x) & x.MASK) >> 112) & 0xFFFF)
 
 
 def dword1(x: Integer) -> UInt32:
     """Implementation of `DWORD1`."""
-    return dwordn(x, 1)
+    return UInt32(((int(x) & x.MASK) >> 32) & 0xFFFFFFFF)
 
 
 def dword2(x: Integer) -> UInt32:
     """Implementation of `DWORD2`."""
-    return dwordn(x, 2)
+    return UInt32(((int(x) & x.MASK) >> 64) & 0xFFFFFFFF)
 
 
 def dword3(x: Integer) -> UInt32:
     """Implementation of `DWORD3`."""
-    return dwordn(x, 3)
+    return UInt32(((int(x) & x.MASK) >> 96) & 0xFFFFFFFF)
 
 
 def sbyten(x: Integer, n: int) -> Int8:
@@ -258,230 +291,256 @@ def sdwordn(x: Integer, n: int) -> Int32:
 
 def slobyte(x: Integer) -> Int8:
     """Implementation of `SLOBYTE`."""
-    return sbyten(x, low_ind(x, Int8))
+    return Int8(int(x) & 0xFF)
 
 
 def sloword(x: Integer) -> Int16:
     """Implementation of `SLOWORD`."""
-    return swordn(x, low_ind(x, Int16))
+    if x.NBITS < 16:
+        v = int(x) & x.MASK
+        return Int16(v - ((v & x.SIGN_BIT) << 1))
+
+    return Int16(int(x) & 0xFFFF)
 
 
 def slodword(x: Integer) -> Int32:
     """Implementation of `SLODWORD`."""
-    return sdwordn(x, low_ind(x, Int32))
+    if x.NBITS < 32:
+        v = int(x) & x.MASK
+        return Int32(v - ((v & x.SIGN_BIT) << 1))
+
+    return Int32(int(x) & 0xFFFFFFFF)
 
 
 def shibyte(x: Integer) -> Int8:
     """Implementation of `SHIBYTE`."""
-    return sbyten(x, high_ind(x, Int8))
+    return Int8((int(x) >> (x.NBITS - 8)) & 0xFF)
 
 
 def shiword(x: Integer) -> Int16:
     """Implementation of `SHIWORD`."""
-    return swordn(x, high_ind(x, Int16))
+    shift = x.NBITS - 16
+    if shift < 0:
+        return Int16(0)
+
+    return Int16((int(x) >> shift) & 0xFFFF)
 
 
 def shidword(x: Integer) -> Int32:
     """Implementation of `SHIDWORD`."""
-    return sdwordn(x, high_ind(x, Int32))
+    shift = x.NBITS - 32
+    if shift < 0:
+        return Int32(0)
+
+    return Int32((int(x) >> shift) & 0xFFFFFFFF)
 
 
 def sbyte1(x: Integer) -> Int8:
     """Implementation of `SBYTE1`."""
-    return sbyten(x, 1)
+    return Int8(((int(x) & x.MASK) >> 8) & 0xFF)
 
 
 def sbyte2(x: Integer) -> Int8:
     """Implementation of `SBYTE2`."""
-    return sbyten(x, 2)
+    return Int8(((int(x) & x.MASK) >> 16) & 0xFF)
 
 
 def sbyte3(x: Integer) -> Int8:
     """Implementation of `SBYTE3`."""
-    return sbyten(x, 3)
+    return Int8(((int(x) & x.MASK) >> 24) & 0xFF)
 
 
 def sbyte4(x: Integer) -> Int8:
     """Implementation of `SBYTE4`."""
-    return sbyten(x, 4)
+    return Int8(((int(x) & x.MASK) >> 32) & 0xFF)
 
 
 def sbyte5(x: Integer) -> Int8:
     """Implementation of `SBYTE5`."""
-    return sbyten(x, 5)
+    return Int8(((int(x) & x.MASK) >> 40) & 0xFF)
 
 
 def sbyte6(x: Integer) -> Int8:
     """Implementation of `SBYTE6`."""
-    return sbyten(x, 6)
+    return Int8(((int(x) & x.MASK) >> 48) & 0xFF)
 
 
 def sbyte7(x: Integer) -> Int8:
     """Implementation of `SBYTE7`."""
-    return sbyten(x, 7)
+    return Int8(((int(x) & x.MASK) >> 56) & 0xFF)
 
 
 def sbyte8(x: Integer) -> Int8:
     """Implementation of `SBYTE8`."""
-    return sbyten(x, 8)
+    return Int8(((int(x) & x.MASK) >> 64) & 0xFF)
 
 
 def sbyte9(x: Integer) -> Int8:
     """Implementation of `SBYTE9`."""
-    return sbyten(x, 9)
+    return Int8(((int(x) & x.MASK) >> 72) & 0xFF)
 
 
 def sbyte10(x: Integer) -> Int8:
     """Implementation of `SBYTE10`."""
-    return sbyten(x, 10)
+    return Int8(((int(x) & x.MASK) >> 80) & 0xFF)
 
 
 def sbyte11(x: Integer) -> Int8:
     """Implementation of `SBYTE11`."""
-    return sbyten(x, 11)
+    return Int8(((int(x) & x.MASK) >> 88) & 0xFF)
 
 
 def sbyte12(x: Integer) -> Int8:
     """Implementation of `SBYTE12`."""
-    return sbyten(x, 12)
+    return Int8(((int(x) & x.MASK) >> 96) & 0xFF)
 
 
 def sbyte13(x: Integer) -> Int8:
     """Implementation of `SBYTE13`."""
-    return sbyten(x, 13)
+    return Int8(((int(x) & x.MASK) >> 104) & 0xFF)
 
 
 def sbyte14(x: Integer) -> Int8:
     """Implementation of `SBYTE14`."""
-    return sbyten(x, 14)
+    return Int8(((int(x) & x.MASK) >> 112) & 0xFF)
 
 
 def sbyte15(x: Integer) -> Int8:
     """Implementation of `SBYTE15`."""
-    return sbyten(x, 15)
+    return Int8(((int(x) & x.MASK) >> 120) & 0xFF)
 
 
 def sword1(x: Integer) -> Int16:
     """Implementation of `SWORD1`."""
-    return swordn(x, 1)
+    return Int16(((int(x) & x.MASK) >> 16) & 0xFFFF)
 
 
 def sword2(x: Integer) -> Int16:
     """Implementation of `SWORD2`."""
-    return swordn(x, 2)
+    return Int16(((int(x) & x.MASK) >> 32) & 0xFFFF)
 
 
 def sword3(x: Integer) -> Int16:
     """Implementation of `SWORD3`."""
-    return swordn(x, 3)
+    return Int16(((int(x) & x.MASK) >> 48) & 0xFFFF)
 
 
 def sword4(x: Integer) -> Int16:
     """Implementation of `SWORD4`."""
-    return swordn(x, 4)
+    return Int16(((int(x) & x.MASK) >> 64) & 0xFFFF)
 
 
 def sword5(x: Integer) -> Int16:
     """Implementation of `SWORD5`."""
-    return swordn(x, 5)
+    return Int16(((int(x) & x.MASK) >> 80) & 0xFFFF)
 
 
 def sword6(x: Integer) -> Int16:
     """Implementation of `SWORD6`."""
-    return swordn(x, 6)
+    return Int16(((int(x) & x.MASK) >> 96) & 0xFFFF)
 
 
 def sword7(x: Integer) -> Int16:
     """Implementation of `SWORD7`."""
-    return swordn(x, 7)
+    return Int16(((int(x) & x.MASK) >> 112) & 0xFFFF)
 
 
 def sdword1(x: Integer) -> Int32:
     """Implementation of `SDWORD1`."""
-    return sdwordn(x, 1)
+    return Int32(((int(x) & x.MASK) >> 32) & 0xFFFFFFFF)
 
 
 def sdword2(x: Integer) -> Int32:
     """Implementation of `SDWORD2`."""
-    return sdwordn(x, 2)
+    return Int32(((int(x) & x.MASK) >> 64) & 0xFFFFFFFF)
 
 
 def sdword3(x: Integer) -> Int32:
     """Implementation of `SDWORD3`."""
-    return sdwordn(x, 3)
+    return Int32(((int(x) & x.MASK) >> 96) & 0xFFFFFFFF)
 
 
 def pair(high: Integer, low: Integer) -> Integer:
     """Implementation of `__PAIR__`."""
-    int_type = Integer.get_type(size=high.size * 2, signed=high.signed)
-    return int_type(high) << high.size * 8 | type(high)(low)
+    try:
+        int_type, shift, low_mask = _PAIR_TABLE[type(high)]
+    except KeyError as e:
+        raise ValueError("No matched type") from e
+
+    return int_type((int(high) << shift) | (int(low) & low_mask))
 
 
 def rol(value: Integer, count: int) -> Integer:
     """Implementation of `__ROL__`."""
-    data_type = type(value)
-    nbits = value.size * 8
-
-    if count > 0:
-        count %= nbits
-        high = value >> (nbits - count)
-        if value.signed:
-            high &= ~(data_type(-1) << count)
-        value <<= count
-        value |= high
-
-    else:
-        count = -count % nbits
-        low = value << (nbits - count)
-        value >>= count
-        value |= low
+    nbits = value.NBITS
+    count %= nbits
+    if count == 0:
+        return value
 
-    return value
+    mask = value.MASK
+    v = int(value) & mask
+    return type(value)(((v << count) | (v >> (nbits - count))) & mask)
 
 
 def rol1(value: UInt8, count: int) -> UInt8:
     """Implementation of `__ROL1__`."""
-    return UInt8(rol(value, count))
+    c = count & 7
+    v = int(value) & 0xFF
+    return UInt8(((v << c) | (v >> (8 - c))) & 0xFF)
 
 
 def rol2(value: UInt16, count: int) -> UInt16:
     """Implementation of `__ROL2__`."""
-    return UInt16(rol(value, count))
+    c = count & 15
+    v = int(value) & 0xFFFF
+    return UInt16(((v << c) | (v >> (16 - c))) & 0xFFFF)
 
 
 def rol4(value: UInt32, count: int) -> UInt32:
     """Implementation of `__ROL4__`."""
-    return UInt32(rol(value, count))
+    c = count & 31
+    v = int(value) & 0xFFFFFFFF
+    return UInt32(((v << c) | (v >> (32 - c))) & 0xFFFFFFFF)
 
 
 def rol8(value: UInt64, count: int) -> UInt64:
     """Implementation of `__ROL8__`."""
-    return UInt64(rol(value, count))
+    c = count & 63
+    v = int(value) & 0xFFFFFFFFFFFFFFFF
+    return UInt64(((v << c) | (v >> (64 - c))) & 0xFFFFFFFFFFFFFFFF)
 
 
 def ror1(value: UInt8, count: int) -> UInt8:
     """Implementation of `__ROR1__`."""
-    return UInt8(rol(value, -count))
+    c = -count & 7
+    v = int(value) & 0xFF
+    return UInt8(((v << c) | (v >> (8 - c))) & 0xFF)
 
 
 def ror2(value: UInt16, count: int) -> UInt16:
     """Implementation of `__ROR2__`."""
-    return UInt16(rol(value, -count))
+    c = -count & 15
+    v = int(value) & 0xFFFF
+    return UInt16(((v << c) | (v >> (16 - c))) & 0xFFFF)
 
 
 def ror4(value: UInt32, count: int) -> UInt32:
     """Implementation of `__ROR4__`."""
-    return UInt32(rol(value, -count))
+    c = -count & 31
+    v = int(value) & 0xFFFFFFFF
+    return UInt32(((v << c) | (v >> (32 - c))) & 0xFFFFFFFF)
 
 
 def ror8(value: UInt64, count: int) -> UInt64:
     """Implementation of `__ROR8__`."""
-    return UInt64(rol(value, -count))
+    c = -count & 63
+    v = int(value) & 0xFFFFFFFFFFFFFFFF
+    return UInt64(((v << c) | (v >> (64 - c))) & 0xFFFFFFFFFFFFFFFF)
 
 
 def mkcshl(value: Integer, count: int) -> int:
     """Implementation of `__MKCSHL__`."""
-    nbits = value.size * 8
+    nbits = value.NBITS
     count %= nbits
     return int((value >> (nbits - count)) & 1)
 
@@ -493,56 +552,118 @@ def mkcshr(value: Integer, count: int) -> int:
 
 def sets(x: Integer) -> int:
     """Implementation of `__SETS__`."""
-    data_type = Integer.get_type(size=x.size, signed=True)
-    return int(data_type(x) < 0)
+    return int((int(x) & x.SIGN_BIT) != 0)
 
 
 def ofsub(x: Integer, y: Integer) -> int:
     """Implementation of `__OFSUB__`."""
-    if x.size < y.size:
-        x2 = x
-        sx = sets(x2)
-        return int((sx ^ sets(y)) & (sx ^ sets(x2 - y)))
-    else:
-        y2 = y
-        sx = sets(x)
-        return int((sx ^ sets(y2)) & (sx ^ sets(x - y2)))
+    wider = x if x.SIZE >= y.SIZE else y
+    mask = wider.MASK
+    sign = wider.NBITS - 1
+
+    ix = int(x) & mask
+    iy = int(y) & mask
+    sx = ix >> sign
+    return (sx ^ (iy >> sign)) & (sx ^ (((ix - iy) & mask) >> sign))
 
 
 def ofadd(x: Integer, y: Integer) -> int:
     """Implementation of `__OFADD__`."""
-    if x.size < y.size:
-        x2 = x
-        sx = sets(x2)
-        return int(((1 ^ sx) ^ sets(y)) & (sx ^ sets(x2 + y)))
-    else:
-        y2 = y
-        sx = sets(x)
-        return int(((1 ^ sx) ^ sets(y2)) & (sx ^ sets(x + y2)))
+    wider = x if x.SIZE >= y.SIZE else y
+    mask = wider.MASK
+    sign = wider.NBITS - 1
+
+    ix = int(x) & mask
+    iy = int(y) & mask
+    sx = ix >> sign
+    return ((1 ^ sx) ^ (iy >> sign)) & (sx ^ (((ix + iy) & mask) >> sign))
 
 
 def cfsub(x: Integer, y: Integer) -> int:
     """Implementation of `__CFSUB__`."""
-    size = max(x.size, y.size)
-    data_type = Integer.get_type(size=size, signed=False)
+    data_type = _TO_UNSIGNED[type(x) if x.SIZE >= y.SIZE else type(y)]
     return int(data_type(x) < data_type(y))
 
 
 def cfadd(x: Integer, y: Integer) -> int:
     """Implementation of `__CFADD__`."""
-    size = max(x.size, y.size)
-    data_type = Integer.get_type(size=size, signed=False)
+    data_type = _TO_UNSIGNED[type(x) if x.SIZE >= y.SIZE else type(y)]
     return int(data_type(x) > data_type(x + y))
 
 
 # Refer to https://gcc.gnu.org/onlinedocs/gcc/Other-Builtins.html.
 
 
-def bswap32(value: UInt32) -> UInt32:
-    """Implementation of `bswap32`."""
-    return value.from_bytes(value.to_bytes()[::-1])
+def bswap16(value: Integer) -> Union[Int16, UInt16]:
+    """Implementation of `bswap16`.
+
+    Only the low 16 bits of ``value`` are swapped. The result is ``Int16`` if
+    ``value`` is signed, otherwise ``UInt16``.
+    """
+    v = int(value)
+    r = ((v & 0xFF) << 8) | ((v >> 8) & 0xFF)
+    return Int16(r) if value.SIGNED else UInt16(r)
+
+
+def bswap32(value: Integer) -> Union[Int32, UInt32]:
+    """Implementation of `bswap32`.
+
+    Only the low 32 bits of ``value`` are swapped. The result is ``Int32`` if
+    ``value`` is signed, otherwise ``UInt32``.
+    """
+    v = int(value)
+    r = (
+        ((v & 0xFF) << 24)
+        | ((v & 0xFF00) << 8)
+        | ((v >> 8) & 0xFF00)
+        | ((v >> 24) & 0xFF)
+    )
+    return Int32(r) if value.SIGNED else UInt32(r)
+
+
+def bswap64(value: Integer) -> Union[Int64, UInt64]:
+    """Implementation of `bswap64`.
+
+    Only the low 64 bits of ``value`` are swapped. The result is ``Int64`` if
+    ``value`` is signed, otherwise ``UInt64``.
+    """
+    v = int(value) & 0xFFFFFFFFFFFFFFFF
+    v = ((v & 0x00FF00FF00FF00FF) << 8) | ((v >> 8) & 0x00FF00FF00FF00FF)
+    v = ((v & 0x0000FFFF0000FFFF) << 16) | ((v >> 16) & 0x0000FFFF0000FFFF)
+    r = ((v & 0x00000000FFFFFFFF) << 32) | (v >> 32)
+    return Int64(r) if value.SIGNED else UInt64(r)
 
 
 def clz(x: Integer) -> int:
     """Implementation of `__clz`."""
-    return x.size * 8 - len(bin(int(x))[2:])
+    return x.NBITS - (int(x) & x.MASK).bit_length()
+
+
+# Bulk variants which operate on buffers of packed little endian 32-bit words.
+
+
+def bswap32_array(data: Union[bytes, bytearray, memoryview]) -> bytearray:
+    """Apply `bswap32` to every 32-bit word of ``data``."""
+    if len(data) % 4:
+        raise ValueError("Data size must be a multiple of 4")
+
+    words = array.array(_UINT32_TYPECODE)
+    words.frombytes(data)
+    words.byteswap()
+    return bytearray(words.tobytes())
+
+
+def rol4_array(data: Union[bytes, bytearray, memoryview], count: int) -> bytearray:
+    """Apply `__ROL4__` to every 32-bit word of ``data``."""
+    if len(data) % 4:
+        raise ValueError("Data size must be a multiple of 4")
+
+    c = count & 31
+    n = len(data) // 4
+
+    # Rotate all words at once as lanes of a single integer.
+    v = int.from_bytes(data, "little")
+    low_mask = int.from_bytes(((1 << (32 - c)) - 1).to_bytes(4, "little") * n, "little")
+    high_mask = int.from_bytes(((1 << c) - 1).to_bytes(4, "little") * n, "little")
+    v = ((v & low_mask) << c) | ((v >> (32 - c)) & high_mask)
+    return bytearray(v.to_bytes(len(data), "little"))
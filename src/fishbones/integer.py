@@ -1,12 +1,17 @@
 import ctypes
+import functools
 import operator
 import re
 import sys
 from typing import (
+    Any,
+    ClassVar,
+    Dict,
     Iterable,
     Optional,
     SupportsBytes,
     SupportsInt,
+    Tuple,
     Type,
     Union,
     get_type_hints,
@@ -20,6 +25,9 @@ else:
     from typing_extensions import Literal, SupportsIndex
 
 
+_TYPE_NAME_PATTERN = re.compile(r"(u*)int(\d+)")
+
+
 class _UnaryOp:
     def __call__(self) -> "Integer":
         pass
@@ -41,6 +49,12 @@ class IntMeta(type):
     def __init__(cls, name, bases, attr_dict):
         super().__init__(name, bases, attr_dict)
 
+        if "SIZE" in attr_dict:
+            cls.NBITS = cls.SIZE * 8
+            cls.MASK = (1 << cls.NBITS) - 1
+            cls.SIGN_BIT = 1 << (cls.NBITS - 1)
+            cls._ctype = getattr(ctypes, "c_%s" % name.lower())
+
         for name, hint_type in get_type_hints(cls).items():
             if hint_type in (_BinaryOp, _UnaryOp):
                 setattr(cls, name, cls.build_operator(name))
@@ -69,13 +83,13 @@ class IntMeta(type):
 
                 if isinstance(y, Integer):
                     # If their sizes are equal, the type of result is unsigned.
-                    if x.size == y.size:
-                        result_type = type(y if x.signed else x)
+                    if x.SIZE == y.SIZE:
+                        result_type = type(y if x.SIGNED else x)
 
                     # If their sizes are not equal, the type of result is
                     # larger size type.
                     else:
-                        if x.size < y.size:
+                        if x.SIZE < y.SIZE:
                             result_type = type(y)
                             x, y = y, x
 
@@ -95,9 +109,18 @@ class IntMeta(type):
 class Integer(metaclass=IntMeta):
     """Base class of integer type."""
 
+    __slots__ = ("_value",)
+
+    SIZE: ClassVar[int]
+    SIGNED: ClassVar[bool]
+    NBITS: ClassVar[int]
+    MASK: ClassVar[int]
+    SIGN_BIT: ClassVar[int]
+
+    _ctype: ClassVar[Any]
+
     def __init__(self, x: SupportsInt):
-        ctypes_cls = getattr(ctypes, "c_%s" % self.__class__.__name__.lower())
-        self._value = ctypes_cls(int(x))
+        self._value = self._ctype(int(x))
 
     __neg__: _UnaryOp
     __pos__: _UnaryOp
@@ -138,11 +161,11 @@ class Integer(metaclass=IntMeta):
 
     @property
     def size(self) -> int:
-        return get_type_size(self.__class__)
+        return self.SIZE
 
     @property
     def signed(self) -> bool:
-        return get_type_signed(self.__class__)
+        return self.SIGNED
 
     @classmethod
     def from_bytes(
@@ -151,19 +174,18 @@ class Integer(metaclass=IntMeta):
         byteorder: Literal["big", "little"] = LITTLE_ENDIAN,
     ):
         """Return a value of this type from given bytes"""
-        return cls(
-            int.from_bytes(data, byteorder=byteorder, signed=get_type_signed(cls))
-        )
+        return cls(int.from_bytes(data, byteorder=byteorder, signed=cls.SIGNED))
 
     def to_bytes(self, byteorder: Literal["big", "little"] = LITTLE_ENDIAN) -> bytes:
         """Covert this value to bytes."""
         return int(self).to_bytes(
-            length=self.size,
+            length=self.SIZE,
             byteorder=byteorder,
-            signed=self.signed,
+            signed=self.SIGNED,
         )
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_type(
         size: Optional[int] = None,
         signed: Optional[bool] = None,
@@ -180,10 +202,13 @@ class Integer(metaclass=IntMeta):
         Raises:
             ValueError: If no matched type.
         """
-        int_types = [Int8, Int16, Int32, Int64, UInt8, UInt16, UInt32, UInt64]
-
         if type_name is not None:
-            match = re.match(r"(u*)int(\d+)", type_name)
+            try:
+                return _INT_TYPE_NAMES[type_name]
+            except KeyError:
+                pass
+
+            match = _TYPE_NAME_PATTERN.match(type_name)
 
             if match:
                 nbits = int(match.group(2))
@@ -192,12 +217,10 @@ class Integer(metaclass=IntMeta):
                     size = nbits // 8
 
         if size is not None and signed is not None:
-            for int_type in int_types:
-                if (
-                    get_type_size(int_type) == size
-                    and get_type_signed(int_type) == signed
-                ):
-                    return int_type
+            try:
+                return _INT_TYPES[(size, bool(signed))]
+            except KeyError:
+                pass
 
         raise ValueError("No matched type")
 
@@ -205,34 +228,84 @@ class Integer(metaclass=IntMeta):
 class Int8(Integer):
     """Int8"""
 
+    __slots__ = ()
+
+    SIZE = 1
+    SIGNED = True
+
 
 class Int16(Integer):
     """Int16"""
 
+    __slots__ = ()
+
+    SIZE = 2
+    SIGNED = True
+
 
 class Int32(Integer):
     """Int32"""
 
+    __slots__ = ()
+
+    SIZE = 4
+    SIGNED = True
+
 
 class Int64(Integer):
     """Int64"""
 
+    __slots__ = ()
+
+    SIZE = 8
+    SIGNED = True
+
 
 class UInt8(Integer):
     """UInt8"""
 
+    __slots__ = ()
+
+    SIZE = 1
+    SIGNED = False
+
 
 class UInt16(Integer):
     """UInt16"""
 
+    __slots__ = ()
+
+    SIZE = 2
+    SIGNED = False
+
 
 class UInt32(Integer):
     """UInt32"""
 
+    __slots__ = ()
+
+    SIZE = 4
+    SIGNED = False
+
 
 class UInt64(Integer):
     """UInt64"""
 
+    __slots__ = ()
+
+    SIZE = 8
+    SIGNED = False
+
+
+_INT_TYPES: Dict[Tuple[int, bool], Type[Integer]] = {
+    (t.SIZE, t.SIGNED): t
+    for t in (Int8, Int16, Int32, Int64, UInt8, UInt16, UInt32, UInt64)
+}
+
+_INT_TYPE_NAMES: Dict[str, Type[Integer]] = {
+    t.__name__.lower(): t for t in _INT_TYPES.values()
+}
+
 
 def int8(x: SupportsInt) -> Int8:
     """Shorthand for `Int8(x)`."""
@@ -276,13 +349,12 @@ def uint64(x: SupportsInt) -> UInt64:
 
 def get_type_size(t: Type[Integer]) -> int:
     """Get size (bytes) of the type."""
-    match_obj = re.match(r"(U*)Int(\d+)", t.__name__)
-    if not match_obj:
-        raise ValueError("Invalid type")
-
-    return int(match_obj.group(2)) // 8
+    try:
+        return t.SIZE
+    except AttributeError as e:
+        raise ValueError("Invalid type") from e
 
 
 def get_type_signed(t: Type[Integer]) -> bool:
     """Get signed of the type."""
-    return bool(re.match(r"Int\d+", t.__name__))
+    return getattr(t, "SIGNED", False)
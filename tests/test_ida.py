@@ -1,29 +1,125 @@
+import functools
+
 import pytest
 
-from fishbones import uint32
+from fishbones import int8, int16, int32, int64, uint8, uint16, uint32, uint64
+from fishbones.decompiler_builtins import ida
+from fishbones.integer import Int16, Int32, UInt16, UInt32, UInt64
 from fishbones.decompiler_builtins.ida import (
+    truncate,
     byten,
     sbyten,
+    wordn,
+    swordn,
+    dwordn,
+    sdwordn,
+    lodword,
+    hidword,
+    slobyte,
+    sloword,
+    slodword,
+    shidword,
+    pair,
     rol4,
     ror4,
     ofsub,
     ofadd,
     cfsub,
     cfadd,
+    bswap16,
     bswap32,
+    bswap64,
+    bswap32_array,
+    rol4_array,
     clz,
 )
 
 
 @pytest.mark.parametrize(
-    "x,n,signed,expected",
+    "func,x,n,expected",
+    [
+        (byten, uint32(0x53683477), 3, 83),
+        (sbyten, uint32(0xFFFFFFFF), 3, -1),
+        (byten, int32(-1), 4, 0),
+        (sbyten, int32(-1), 4, 0),
+        (sdwordn, int16(-2), 0, -2),
+        (swordn, int8(-1), 0, -1),
+        (functools.partial(truncate, to_type=Int16), int32(-0x100), 3, -1),
+        (functools.partial(truncate, to_type=UInt16), int32(-0x100), 3, 0xFF),
+    ],
+)
+def test_byte_n(func, x, n, expected):
+    result = func(x, n)
+
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "name,part_n,n",
+    [("byte", byten, n) for n in range(1, 16)]
+    + [("sbyte", sbyten, n) for n in range(1, 16)]
+    + [("word", wordn, n) for n in range(1, 8)]
+    + [("sword", swordn, n) for n in range(1, 8)]
+    + [("dword", dwordn, n) for n in range(1, 4)]
+    + [("sdword", sdwordn, n) for n in range(1, 4)],
+)
+@pytest.mark.parametrize(
+    "x",
+    [
+        uint64(0x0123456789ABCDEF),
+        int64(-0x0123456789ABCDEF),
+        int32(-5),
+        int16(-2),
+        uint8(0xFF),
+    ],
+)
+def test_part(name, part_n, n, x):
+    result = getattr(ida, "%s%d" % (name, n))(x)
+
+    assert type(result) is type(part_n(x, n))
+    assert result == part_n(x, n)
+
+
+@pytest.mark.parametrize(
+    "func,x,expected",
+    [
+        (lodword, uint64(0x0123456789ABCDEF), 0x89ABCDEF),
+        (hidword, uint64(0x0123456789ABCDEF), 0x01234567),
+        (slodword, uint64(0x0123456789ABCDEF), -0x76543211),
+        (shidword, int64(-1), -1),
+        (lodword, int8(-118), 0x8A),
+        (slodword, uint16(0xFA14), -1516),
+        (hidword, uint16(5), 0),
+        (shidword, int8(-1), 0),
+    ],
+)
+def test_lo_hi(func, x, expected):
+    result = func(x)
+
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "slo,part_n",
+    [(slobyte, sbyten), (sloword, swordn), (slodword, sdwordn)],
+)
+@pytest.mark.parametrize(
+    "x",
+    [int8(-2), int16(-2), uint8(0xFE), uint16(0xFA14), int32(-5), int64(-5)],
+)
+def test_slo_matches_part_n(slo, part_n, x):
+    assert slo(x) == part_n(x, 0)
+
+
+@pytest.mark.parametrize(
+    "high,low,expected",
     [
-        (uint32(0x53683477), 3, False, 83),
-        (uint32(0xFFFFFFFF), 3, True, -1),
+        (uint16(0x5368), uint16(0x3477), 0x53683477),
+        (int8(1), int8(-1), 0x01FF),
     ],
 )
-def test_byte_n(x, n, signed, expected):
-    result = (sbyten if signed else byten)(x, n)
+def test_pair(high, low, expected):
+    result = pair(high, low)
 
     assert result == expected
 
@@ -46,6 +142,7 @@ def test_rol(value, count, expected):
     [
         (uint32(0x53683477), 2, 0xD4DA0D1D),
         (uint32(0xD4DA0D1D), 4, 0xDD4DA0D1),
+        (int32(-2), 1, 0x7FFFFFFF),
     ],
 )
 def test_ror(value, count, expected):
@@ -59,6 +156,8 @@ def test_ror(value, count, expected):
     [
         (uint32(0x80000000), uint32(0), 0),
         (uint32(0x80000000), uint32(1), 1),
+        (int8(1), int16(-0x8000), 1),
+        (int8(-1), int16(0x7FFF), 0),
     ],
 )
 def test_ofsub(x, y, expected):
@@ -72,6 +171,9 @@ def test_ofsub(x, y, expected):
     [
         (uint32(0x7FFFFFFF), uint32(0), 0),
         (uint32(0x7FFFFFFF), uint32(1), 1),
+        (uint8(0xFF), int16(0x7FFF), 1),
+        (int8(-1), int16(-0x8000), 1),
+        (int16(-19), uint8(0xB9), 0),
     ],
 )
 def test_ofadd(x, y, expected):
@@ -109,12 +211,35 @@ def test_cfadd(x, y, expected):
 @pytest.mark.parametrize(
     "value,expected",
     [
+        (uint16(0x5368), 0x6853),
         (uint32(0x53683477), 0x77346853),
+        (uint64(0x5368347753683477), 0x7734685377346853),
+        (uint64(0x0102030405060708), 0x0807060504030201),
+        (int32(0x01020380), -0x7FFCFDFF),
     ],
 )
 def test_bswap(value, expected):
-    result = bswap32(value)
+    bswap = {2: bswap16, 4: bswap32, 8: bswap64}[value.size]
+    result = bswap(value)
+
+    assert type(result) is type(value)
+    assert result == expected
+
 
+@pytest.mark.parametrize(
+    "bswap,value,expected_type,expected",
+    [
+        (bswap32, int64(-1), Int32, -1),
+        (bswap32, uint64(0x1122334455667788), UInt32, 0x88776655),
+        (bswap32, int8(1), Int32, 0x01000000),
+        (bswap16, uint32(0x11223344), UInt16, 0x4433),
+        (bswap64, uint8(0x80), UInt64, 0x8000000000000000),
+    ],
+)
+def test_bswap_other_width(bswap, value, expected_type, expected):
+    result = bswap(value)
+
+    assert type(result) is expected_type
     assert result == expected
 
 
@@ -123,9 +248,50 @@ def test_bswap(value, expected):
     [
         (uint32(0x53), 25),
         (uint32(0x683477), 9),
+        (uint32(0), 32),
+        (int32(-1), 0),
     ],
 )
 def test_clz(x, expected):
     result = clz(x)
 
     assert result == expected
+
+
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        (
+            bytearray([0x77, 0x34, 0x68, 0x53, 0x01, 0x02, 0x03, 0x04]),
+            bytearray([0x53, 0x68, 0x34, 0x77, 0x04, 0x03, 0x02, 0x01]),
+        ),
+        (
+            memoryview(b"\x01\x02\x03\x04"),
+            bytearray([0x04, 0x03, 0x02, 0x01]),
+        ),
+    ],
+)
+def test_bswap32_array(data, expected):
+    result = bswap32_array(data)
+
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "data,count",
+    [
+        (bytearray([0x77, 0x34, 0x68, 0x53, 0xDD, 0xD1, 0xA0, 0x4D]), 0),
+        (bytearray([0x77, 0x34, 0x68, 0x53, 0xDD, 0xD1, 0xA0, 0x4D]), 4),
+        (bytearray([0x77, 0x34, 0x68, 0x53, 0xDD, 0xD1, 0xA0, 0x4D]), -2),
+        (memoryview(b"\x77\x34\x68\x53"), 7),
+    ],
+)
+def test_rol4_array(data, count):
+    result = rol4_array(data, count)
+
+    words = [
+        uint32(int.from_bytes(data[i : i + 4], "little"))
+        for i in range(0, len(data), 4)
+    ]
+    expected = b"".join(rol4(w, count).to_bytes() for w in words)
+    assert result == expected
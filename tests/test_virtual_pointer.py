@@ -102,6 +102,7 @@ def test_write_bytes(source_data, write_offset, write_data, expected):
         "uint16",
         "uint32",
         "uint64",
+        "uint32_t",
     ],
 )
 def test_cast(type_or_name):